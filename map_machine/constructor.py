@@ -1,6 +1,7 @@
 """Construct Map Machine nodes and ways."""
 import logging
 import sys
+from bisect import bisect_left
 from datetime import datetime
 from hashlib import sha256
 from typing import Any, Iterator, Optional, Union
@@ -527,6 +528,36 @@ class Constructor:
         """Get all figures sorted by priority."""
         return sorted(self.figures, key=lambda x: x.line_style.priority)
 
+    def get_partitioned_figures(
+        self, priority: float
+    ) -> tuple[list[StyledFigure], list[StyledFigure]]:
+        """
+        Get all figures sorted by priority and split into figures with lower
+        priority and figures with the same or higher priority.
+
+        :param priority: priority of the partition point
+        """
+        figures: list[StyledFigure] = self.get_sorted_figures()
+        priorities: list[float] = [x.line_style.priority for x in figures]
+        index: int = bisect_left(priorities, priority)
+
+        return figures[:index], figures[index:]
+
+    def get_sorted_points(self) -> list[Point]:
+        """
+        Get all points sorted by priority in descending order.  Points with the
+        same priority keep the order of construction.
+        """
+        priorities: np.ndarray = np.fromiter(
+            (x.priority for x in self.points),
+            dtype=np.float64,
+            count=len(self.points),
+        )
+        return [
+            self.points[index]
+            for index in np.argsort(-priorities, kind="stable")
+        ]
+
 
 def check_level_number(tags: Tags, level: float) -> bool:
     """Check if element described by tags is no the specified level."""
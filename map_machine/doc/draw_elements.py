@@ -1,13 +1,14 @@
 """Draw test nodes, ways, and relations."""
+import io
 import logging
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
-from svgwrite import Drawing
 from svgwrite.text import Text
 
 from map_machine.constructor import Constructor
+from map_machine.drawing import SVGBuffer
 from map_machine.geometry.boundary_box import BoundaryBox
 from map_machine.geometry.flinger import Flinger
 from map_machine.map_configuration import MapConfiguration
@@ -106,14 +107,39 @@ class Grid:
         self.osm_data: OSMData = OSMData()
         self.texts: list[tuple[str, int, int]] = []
 
-    def add_node(self, tags: Tags, i: int, j: int) -> OSMNode:
-        """Add OSM node to the grid."""
+    def get_coordinates(self, height: int, width: int) -> np.ndarray:
+        """
+        Compute geo coordinates of all grid cells at once.
+
+        :param height: number of grid rows
+        :param width: number of grid columns
+        :return: array of shape (height, width, 2) with coordinates of the
+            cell (i, j) at index [i, j]
+        """
+        latitudes: np.ndarray = -np.arange(height)[:, None] * self.y_step
+        longitudes: np.ndarray = np.arange(width)[None, :] * self.x_step
+        return np.stack(np.broadcast_arrays(latitudes, longitudes), axis=-1)
+
+    def add_node(
+        self,
+        tags: Tags,
+        i: int,
+        j: int,
+        coordinates: Optional[np.ndarray] = None,
+    ) -> OSMNode:
+        """
+        Add OSM node to the grid.
+
+        :param tags: node tags
+        :param i: grid row
+        :param j: grid column
+        :param coordinates: precomputed coordinates of the cell (see
+            `get_coordinates`)
+        """
+        if coordinates is None:
+            coordinates = np.array((-i * self.y_step, j * self.x_step))
         self.index += 1
-        node: OSMNode = OSMNode(
-            tags,
-            self.index,
-            np.array((-i * self.y_step, j * self.x_step)),
-        )
+        node: OSMNode = OSMNode(tags, self.index, coordinates)
         self.nodes[node] = (j, i)
         self.osm_data.add_node(node)
         self.max_j = max(self.max_j, j * self.x_step)
@@ -153,7 +179,7 @@ class Grid:
         flinger: Flinger = Flinger(
             self.get_boundary_box(), zoom, self.osm_data.equator_length
         )
-        svg: Drawing = Drawing(output_path.name, flinger.size)
+        svg: SVGBuffer = SVGBuffer(output_path.name, flinger.size)
         constructor: Constructor = Constructor(
             self.osm_data, flinger, SCHEME, SHAPE_EXTRACTOR, configuration
         )
@@ -171,9 +197,10 @@ class Grid:
                 )
             )
 
-        with output_path.open("w") as output_file:
-            svg.write(output_file)
-            logging.info(f"Map is drawn to {output_path}.")
+        buffer: io.StringIO = io.StringIO()
+        svg.write(buffer)
+        output_path.write_text(buffer.getvalue(), encoding="utf-8")
+        logging.info(f"Map is drawn to {output_path}.")
 
 
 def draw_overlapped_ways(types: list[dict[str, str]], path: Path) -> None:
@@ -201,16 +228,18 @@ def draw_road_features(
 ) -> None:
     """Draw test image with different road features."""
     grid: Grid = Grid()
+    coordinates: np.ndarray = grid.get_coordinates(
+        len(types), len(features) + 1
+    )
 
     for i, type_ in enumerate(types):
         previous: Optional[OSMNode] = None
 
         for j in range(len(features) + 1):
-            node: OSMNode = grid.add_node({}, i, j)
+            node: OSMNode = grid.add_node({}, i, j, coordinates[i, j])
 
             if previous:
-                tags: dict[str, str] = dict(type_)
-                tags |= dict(features[j - 1])
+                tags: dict[str, str] = type_ | features[j - 1]
                 grid.add_way(tags, [previous, node])
             previous = node
 
@@ -5,9 +5,9 @@ from pathlib import Path
 from typing import Optional
 
 import numpy as np
-import svgwrite
 
 from map_machine.constructor import Constructor
+from map_machine.drawing import SVGBuffer
 from map_machine.geometry.boundary_box import BoundaryBox
 from map_machine.geometry.flinger import Flinger
 from map_machine.map_configuration import (
@@ -51,9 +51,7 @@ def draw(
     )
     constructor.construct()
 
-    svg: svgwrite.Drawing = svgwrite.Drawing(
-        str(output_file_name), size=flinger.size
-    )
+    svg: SVGBuffer = SVGBuffer(str(output_file_name), size=flinger.size)
     map_: Map = Map(flinger, svg, SCHEME, configuration)
     map_.draw(constructor)
 
@@ -1,7 +1,9 @@
 """Drawing utility."""
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 
 import cairo
 import numpy as np
@@ -137,6 +139,86 @@ class SVGDrawing(Drawing):
             self.image.write(output_file)
 
 
+class SVGBuffer(svgwrite.Drawing):
+    """
+    SVG drawing that also accepts pre-serialized markup.
+
+    Bulk elements (e.g. map figures) are appended as ready strings, so no
+    svgwrite element is constructed for them.  Usual svgwrite elements are
+    still supported and are serialized when the drawing is written.
+    """
+
+    def write_raw(self, markup: str) -> None:
+        """Append pre-serialized SVG markup to the drawing."""
+        self.elements.append(markup)
+
+    def tostring(self) -> str:
+        """Get the XML representation of the drawing and all its elements."""
+        elements: list[Union[str, BaseElement]] = self.elements
+        self.elements = []
+        try:
+            root: str = ElementTree.tostring(self.get_xml(), encoding="unicode")
+        finally:
+            self.elements = elements
+
+        parts: list[str] = [root.removesuffix(" />"), ">"]
+        for element in elements:
+            if isinstance(element, str):
+                parts.append(element)
+            else:
+                parts.append(
+                    ElementTree.tostring(element.get_xml(), encoding="unicode")
+                )
+        parts.append("</svg>")
+
+        return "".join(parts)
+
+
+class SVGLayer:
+    """
+    Part of SVG drawing, which elements are added to the drawing later.
+
+    Layer may be used instead of the drawing: element factories (e.g.
+    `layer.text(...)`) are taken from the drawing, but added elements are only
+    collected.
+    """
+
+    def __init__(self, svg: svgwrite.Drawing) -> None:
+        self.svg: svgwrite.Drawing = svg
+        self.elements: list[BaseElement] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.svg, name)
+
+    def add(self, element: BaseElement) -> BaseElement:
+        """Collect SVG element."""
+        self.elements.append(element)
+        return element
+
+    def flush(self) -> None:
+        """Add all collected elements to the drawing."""
+        self.svg.elements.extend(self.elements)
+        self.elements = []
+
+
+def get_svg_attributes(style: dict[str, Any]) -> str:
+    """
+    Serialize style into SVG attributes string.  Every attribute is prefixed
+    with a space, so that the result may be directly appended to a tag name.
+
+    :param style: SVG attributes, keys follow svgwrite convention
+    """
+    attributes: list[str] = []
+    for key, value in style.items():
+        if value is None:
+            continue
+        key = key.rstrip("_").replace("_", "-")
+        value = escape(str(value), {'"': "&quot;"})
+        attributes.append(f' {key}="{value}"')
+
+    return "".join(attributes)
+
+
 class PNGDrawing(Drawing):
     """PNG image."""
 
@@ -1,11 +1,12 @@
 """Buildings on the map."""
+from typing import Optional
+
 import numpy as np
 from colour import Color
 from svgwrite import Drawing
-from svgwrite.container import Group
 from svgwrite.path import Path
 
-from map_machine.drawing import PathCommands
+from map_machine.drawing import get_svg_attributes
 from map_machine.figure import Figure
 from map_machine.geometry.flinger import Flinger
 from map_machine.geometry.vector import Segment
@@ -16,6 +17,9 @@ BUILDING_MINIMAL_HEIGHT: float = 8.0
 BUILDING_SCALE: float = 0.33
 LEVEL_HEIGHT: float = 2.5
 SHADE_SCALE: float = 0.4
+SHADE_ATTRIBUTES: str = get_svg_attributes(
+    {"fill": "#000000", "stroke": "#000000", "stroke_width": 1.0}
+)
 
 
 class Building(Figure):
@@ -54,10 +58,11 @@ class Building(Figure):
         self.parts: list[Segment] = []
 
         for nodes in self.inners + self.outers:
+            points: np.ndarray = flinger.fling_batch(
+                np.array([node.coordinates for node in nodes])
+            )
             for i in range(len(nodes) - 1):
-                flung_1: np.ndarray = flinger.fling(nodes[i].coordinates)
-                flung_2: np.ndarray = flinger.fling(nodes[i + 1].coordinates)
-                self.parts.append(Segment(flung_1, flung_2))
+                self.parts.append(Segment(points[i], points[i + 1]))
 
         self.parts = sorted(self.parts)
 
@@ -111,33 +116,33 @@ class Building(Figure):
         )
         svg.add(path)
 
-    def draw_shade(self, building_shade: Group, flinger: Flinger) -> None:
-        """Draw shade casted by the building."""
+    def draw_shade(self, shade_paths: list[str], flinger: Flinger) -> None:
+        """
+        Draw shade casted by the building.
+
+        :param shade_paths: list to append serialized SVG paths of the shade to
+        :param flinger: converter for geo coordinates
+        """
         scale: float = flinger.get_scale() * SHADE_SCALE
         shift_1: np.ndarray = np.array((scale * self.min_height, 0.0))
         shift_2: np.ndarray = np.array((scale * self.height, 0.0))
         commands: str = self.get_path(flinger, shift_1)
-        path: Path = Path(
-            commands, fill="#000000", stroke="#000000", stroke_width=1.0
-        )
-        building_shade.add(path)
+        shade_paths.append(f'<path d="{commands}"{SHADE_ATTRIBUTES} />')
         for nodes in self.inners + self.outers:
+            points: np.ndarray = flinger.fling_batch(
+                np.array([node.coordinates for node in nodes])
+            )
+            points_1: np.ndarray = points + shift_1
+            points_2: np.ndarray = points + shift_2
             for i in range(len(nodes) - 1):
-                flung_1 = flinger.fling(nodes[i].coordinates)
-                flung_2 = flinger.fling(nodes[i + 1].coordinates)
-                command: PathCommands = [
-                    "M",
-                    np.add(flung_1, shift_1),
-                    "L",
-                    np.add(flung_2, shift_1),
-                    np.add(flung_2, shift_2),
-                    np.add(flung_1, shift_2),
-                    "Z",
-                ]
-                path: Path = Path(
-                    command, fill="#000000", stroke="#000000", stroke_width=1.0
+                x_1, y_1 = points_1[i]
+                x_2, y_2 = points_1[i + 1]
+                x_3, y_3 = points_2[i + 1]
+                x_4, y_4 = points_2[i]
+                shade_paths.append(
+                    f'<path d="M {x_1} {y_1} L {x_2} {y_2} {x_3} {y_3} '
+                    f'{x_4} {y_4} Z"{SHADE_ATTRIBUTES} />'
                 )
-                building_shade.add(path)
 
     def draw_walls(
         self, svg: Drawing, height: float, previous_height: float, scale: float
@@ -167,30 +172,70 @@ class Building(Figure):
         svg.add(path)
 
 
-def draw_walls(svg, building: Building, segment, height, shift_1, shift_2):
-    fill: str
+def get_active_walls(
+    height: float, min_heights: np.ndarray, max_heights: np.ndarray
+) -> np.ndarray:
+    """
+    Get walls visible at the height.  Wall is drawn for every height within
+    (minimum height, maximum height].
+
+    :param height: height to check walls at
+    :param min_heights: array of shape (W,) with minimum heights of walls
+    :param max_heights: array of shape (W,) with maximum heights of walls
+    :return: boolean mask of shape (W,)
+    """
+    return (max_heights >= height) & (min_heights < height)
+
+
+def get_wall_fill(building: Building, segment: Segment) -> str:
+    """
+    Get fill color of the building wall depending on the wall direction.
+
+    This color doesn't depend on the height, so it may be computed once per
+    wall.  Bottom parts of ordinary buildings use separate colors (see
+    `draw_walls`).
+    """
     if building.is_construction:
         color_part: float = segment.angle * 0.2
-        fill = Color(
+        return Color(
             rgb=(
                 building.wall_color.get_red() + color_part,
                 building.wall_color.get_green() + color_part,
                 building.wall_color.get_blue() + color_part,
             )
         ).hex
+
+    color_part: float = segment.angle * 0.2 - 0.1
+    return Color(
+        rgb=(
+            max(min(building.wall_color.get_red() + color_part, 1), 0),
+            max(min(building.wall_color.get_green() + color_part, 1), 0),
+            max(min(building.wall_color.get_blue() + color_part, 1), 0),
+        )
+    ).hex
+
+
+def draw_walls(
+    svg,
+    building: Building,
+    segment,
+    height,
+    shift_1,
+    shift_2,
+    wall_fill: Optional[str] = None,
+):
+    """
+    Draw building wall part between two heights.
+
+    :param wall_fill: precomputed result of `get_wall_fill` for the segment
+    """
+    fill: str
+    if building.is_construction or height > 0.5 / BUILDING_SCALE:
+        fill = wall_fill or get_wall_fill(building, segment)
     elif height <= 0.25 / BUILDING_SCALE:
         fill = building.wall_bottom_color_1.hex
-    elif height <= 0.5 / BUILDING_SCALE:
-        fill = building.wall_bottom_color_2.hex
     else:
-        color_part: float = segment.angle * 0.2 - 0.1
-        fill = Color(
-            rgb=(
-                max(min(building.wall_color.get_red() + color_part, 1), 0),
-                max(min(building.wall_color.get_green() + color_part, 1), 0),
-                max(min(building.wall_color.get_blue() + color_part, 1), 0),
-            )
-        ).hex
+        fill = building.wall_bottom_color_2.hex
 
     command = (
         "M",
@@ -377,7 +377,11 @@ class Road(Tagged):
         self.matcher: RoadMatcher = matcher
 
         self.line: Polyline = Polyline(
-            [flinger.fling(node.coordinates) for node in self.nodes]
+            list(
+                flinger.fling_batch(
+                    np.array([node.coordinates for node in self.nodes])
+                )
+            )
         )
         self.width: Optional[float] = matcher.default_width
         self.lanes: list[Lane] = []
@@ -40,15 +40,10 @@ class Figure(Tagged):
         :param flinger: converter for geo coordinates
         :param offset: offset vector
         """
-        path: str = ""
-
-        for outer_nodes in self.outers:
-            path += f"{get_path(outer_nodes, offset, flinger)} "
-
-        for inner_nodes in self.inners:
-            path += f"{get_path(inner_nodes, offset, flinger)} "
-
-        return path
+        return "".join(
+            f"{get_path(nodes, offset, flinger)} "
+            for nodes in self.outers + self.inners
+        )
 
 
 class StyledFigure(Figure):
@@ -75,21 +70,12 @@ class StyledFigure(Figure):
         :param flinger: converter for geo coordinates
         :param offset: offset vector
         """
-        path: str = ""
+        parallel_offset: float = self.line_style.parallel_offset
 
-        for outer_nodes in self.outers:
-            commands: str = get_path(
-                outer_nodes, offset, flinger, self.line_style.parallel_offset
-            )
-            path += f"{commands} "
-
-        for inner_nodes in self.inners:
-            commands: str = get_path(
-                inner_nodes, offset, flinger, self.line_style.parallel_offset
-            )
-            path += f"{commands} "
-
-        return path
+        return "".join(
+            f"{get_path(nodes, offset, flinger, parallel_offset)} "
+            for nodes in self.outers + self.inners
+        )
 
 
 def is_clockwise(polygon: list[OSMNode]) -> bool:
@@ -132,6 +118,8 @@ def get_path(
     parallel_offset: float = 0.0,
 ) -> str:
     """Construct SVG path commands from nodes."""
-    return Polyline(
-        [flinger.fling(node.coordinates) + shift for node in nodes]
-    ).get_path(parallel_offset)
+    points: np.ndarray = (
+        flinger.fling_batch(np.array([node.coordinates for node in nodes]))
+        + shift
+    )
+    return Polyline(list(points)).get_path(parallel_offset)
@@ -80,6 +80,29 @@ class Flinger:
 
         return result
 
+    def fling_batch(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+        Convert array of geo coordinates into SVG position points at once.
+
+        :param coordinates: array of shape (N, 2) with latitudes and longitudes
+        :return: array of shape (N, 2) with points
+        """
+        result: np.ndarray = np.empty(coordinates.shape)
+        result[:, 0] = coordinates[:, 1]
+        result[:, 1] = (
+            180.0
+            / np.pi
+            * np.log(np.tan(np.pi / 4.0 + coordinates[:, 0] * np.pi / 360.0))
+        )
+        result = self.ratio * (
+            result - pseudo_mercator(self.geo_boundaries.min_())
+        )
+
+        # Invert y axis on coordinate plane.
+        result[:, 1] = self.size[1] - result[:, 1]
+
+        return result
+
     def get_scale(self, coordinates: Optional[np.ndarray] = None) -> float:
         """
         Return pixels per meter ratio for the given geo coordinates.
@@ -92,3 +115,15 @@ class Flinger:
 
         scale_factor: float = abs(1.0 / np.cos(coordinates[0] / 180.0 * np.pi))
         return self.pixels_per_meter * scale_factor
+
+    def get_scale_batch(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+        Return pixels per meter ratios for array of geo coordinates at once.
+
+        :param coordinates: array of shape (N, 2) with latitudes and longitudes
+        :return: array of shape (N,) with scales
+        """
+        scale_factors: np.ndarray = np.abs(
+            1.0 / np.cos(coordinates[:, 0] / 180.0 * np.pi)
+        )
+        return self.pixels_per_meter * scale_factors
@@ -56,6 +56,7 @@ class MapConfiguration:
     use_building_colors: bool = False
     show_overlapped: bool = False
     credit: Optional[str] = "© OpenStreetMap contributors"
+    jobs: int = 1
 
     @classmethod
     def from_options(
@@ -76,6 +77,7 @@ class MapConfiguration:
             options.roofs,
             options.building_colors,
             options.show_overlapped,
+            jobs=options.jobs,
         )
 
     def is_wireframe(self) -> bool:
@@ -1,21 +1,26 @@
 """Simple OpenStreetMap renderer."""
 import argparse
+import io
 import logging
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator, Optional
 
 import numpy as np
-import svgwrite
 from colour import Color
-from svgwrite.container import Group
-from svgwrite.path import Path as SVGPath
-from svgwrite.shapes import Rect
 
 from map_machine import __project__
 from map_machine.constructor import Constructor
-from map_machine.drawing import draw_text
-from map_machine.feature.building import Building, draw_walls, BUILDING_SCALE
+from map_machine.drawing import SVGBuffer, SVGLayer, draw_text
+from map_machine.feature.building import (
+    BUILDING_SCALE,
+    Building,
+    draw_walls,
+    get_active_walls,
+    get_wall_fill,
+)
 from map_machine.feature.road import Intersection, Road, RoadPart
 from map_machine.figure import StyledFigure
 from map_machine.geometry.boundary_box import BoundaryBox
@@ -24,7 +29,7 @@ from map_machine.geometry.vector import Segment
 from map_machine.map_configuration import LabelMode, MapConfiguration
 from map_machine.osm.osm_getter import NetworkError, get_osm
 from map_machine.osm.osm_reader import OSMData, OSMNode
-from map_machine.pictogram.icon import ShapeExtractor
+from map_machine.pictogram.icon import ShapeExtractor, get_shape_extractor
 from map_machine.pictogram.point import Occupied, Point
 from map_machine.scheme import Scheme
 from map_machine.ui.cli import BuildingMode
@@ -42,12 +47,12 @@ class Map:
     def __init__(
         self,
         flinger: Flinger,
-        svg: svgwrite.Drawing,
+        svg: SVGBuffer,
         scheme: Scheme,
         configuration: MapConfiguration,
     ) -> None:
         self.flinger: Flinger = flinger
-        self.svg: svgwrite.Drawing = svg
+        self.svg: SVGBuffer = svg
         self.scheme: Scheme = scheme
         self.configuration = configuration
 
@@ -57,35 +62,30 @@ class Map:
 
     def draw(self, constructor: Constructor) -> None:
         """Draw map."""
-        self.svg.add(
-            Rect((0.0, 0.0), self.flinger.size, fill=self.background_color)
+        self.svg.write_raw(
+            f'<rect x="0" y="0" width="{self.flinger.size[0]}" '
+            f'height="{self.flinger.size[1]}" '
+            f'fill="{self.background_color.hex}" />'
         )
         logging.info("Drawing ways...")
 
-        figures: list[StyledFigure] = constructor.get_sorted_figures()
-
-        top_figures: list[StyledFigure] = [
-            x for x in figures if x.line_style.priority >= ROAD_PRIORITY
-        ]
-        bottom_figures: list[StyledFigure] = [
-            x for x in figures if x.line_style.priority < ROAD_PRIORITY
-        ]
+        bottom_figures: list[StyledFigure]
+        top_figures: list[StyledFigure]
+        bottom_figures, top_figures = constructor.get_partitioned_figures(
+            ROAD_PRIORITY
+        )
 
-        for figure in bottom_figures:
-            path_commands: str = figure.get_path(self.flinger)
-            if path_commands:
-                path: SVGPath = SVGPath(d=path_commands)
-                path.update(figure.line_style.style)
-                self.svg.add(path)
+        for figure, path_commands in zip(
+            bottom_figures, self.get_figure_paths(bottom_figures)
+        ):
+            self.draw_figure(figure, path_commands)
 
         constructor.roads.draw(self.svg, self.flinger)
 
-        for figure in top_figures:
-            path_commands: str = figure.get_path(self.flinger)
-            if path_commands:
-                path: SVGPath = SVGPath(d=path_commands)
-                path.update(figure.line_style.style)
-                self.svg.add(path)
+        for figure, path_commands in zip(
+            top_figures, self.get_figure_paths(top_figures)
+        ):
+            self.draw_figure(figure, path_commands)
 
         for tree in constructor.trees:
             tree.draw(self.svg, self.flinger, self.scheme)
@@ -109,28 +109,73 @@ class Map:
                 self.configuration.overlap,
             )
 
-        nodes: list[Point] = sorted(
-            constructor.points, key=lambda x: -x.priority
+        nodes: list[Point] = constructor.get_sorted_points()
+        draw_texts: bool = (
+            not self.configuration.is_wireframe()
+            and self.configuration.label_mode != LabelMode.NO
         )
-        logging.info("Drawing main icons...")
-        for node in nodes:
-            node.draw_main_shapes(self.svg, occupied)
-
-        logging.info("Drawing extra icons...")
-        for point in nodes:
-            point.draw_extra_shapes(self.svg, occupied)
-
-        logging.info("Drawing texts...")
-        for point in nodes:
-            if (
-                not self.configuration.is_wireframe()
-                and self.configuration.label_mode != LabelMode.NO
-            ):
+
+        if occupied is None:
+            self.draw_points(nodes, draw_texts)
+        else:
+            # Main icons of all points should occupy space before any extra
+            # icon or text, so points are processed in three passes.
+            logging.info("Drawing main icons...")
+            for node in nodes:
+                node.draw_main_shapes(self.svg, occupied)
+
+            logging.info("Drawing extra icons...")
+            for point in nodes:
+                point.draw_extra_shapes(self.svg, occupied)
+
+            logging.info("Drawing texts...")
+            if draw_texts:
+                for point in nodes:
+                    point.draw_texts(
+                        self.svg, occupied, self.configuration.label_mode
+                    )
+
+        self.draw_credits(constructor.flinger.size)
+
+    def draw_points(self, points: list[Point], draw_texts: bool) -> None:
+        """
+        Draw icons and texts of points without overlap checking.  Every point
+        is processed once, its elements are collected into separate layers, so
+        that all main icons are still drawn below extra icons and texts.
+        """
+        logging.info("Drawing icons and texts...")
+        layers: list[SVGLayer] = [SVGLayer(self.svg) for _ in range(3)]
+        main_layer, extra_layer, text_layer = layers
+
+        for point in points:
+            point.draw_main_shapes(main_layer)
+            point.draw_extra_shapes(extra_layer)
+            if draw_texts:
                 point.draw_texts(
-                    self.svg, occupied, self.configuration.label_mode
+                    text_layer, label_mode=self.configuration.label_mode
                 )
 
-        self.draw_credits(constructor.flinger.size)
+        for layer in layers:
+            layer.flush()
+
+    def get_figure_paths(self, figures: list[StyledFigure]) -> list[str]:
+        """
+        Compute SVG path commands for figures.  If more than one job is
+        configured, paths are computed in a thread pool.
+        """
+        if self.configuration.jobs <= 1:
+            return [figure.get_path(self.flinger) for figure in figures]
+
+        with ThreadPoolExecutor(self.configuration.jobs) as executor:
+            return list(
+                executor.map(lambda x: x.get_path(self.flinger), figures)
+            )
+
+    def draw_figure(self, figure: StyledFigure, path_commands: str) -> None:
+        """Write figure as SVG path directly into the drawing buffer."""
+        if path_commands:
+            attributes: str = figure.line_style.svg_attributes()
+            self.svg.write_raw(f'<path d="{path_commands}"{attributes} />')
 
     def draw_buildings(self, constructor: Constructor) -> None:
         """Draw buildings: shade, walls, and roof."""
@@ -144,67 +189,108 @@ class Map:
         logging.info("Drawing buildings...")
 
         scale: float = self.flinger.get_scale()
-        building_shade: Group = Group(opacity=0.1)
+        shade_paths: list[str] = []
         for building in constructor.buildings:
-            building.draw_shade(building_shade, self.flinger)
-        self.svg.add(building_shade)
+            building.draw_shade(shade_paths, self.flinger)
+        self.svg.write_raw(f'<g opacity="0.1">{"".join(shade_paths)}</g>')
+
+        # Walls are stored as a structure of arrays sorted by vertical position,
+        # so that the walls visible at some height may be selected at once.
+        walls: list[tuple[Segment, Building]] = sorted(
+            (
+                (part, building)
+                for building in constructor.buildings
+                for part in building.parts
+            ),
+            key=lambda x: x[0].y,
+        )
+        wall_segments: list[Segment] = [x[0] for x in walls]
+        wall_buildings: list[Building] = [x[1] for x in walls]
+        wall_min_heights: np.ndarray = np.array(
+            [x.min_height for x in wall_buildings], dtype=float
+        )
+        wall_heights: np.ndarray = np.array(
+            [x.height for x in wall_buildings], dtype=float
+        )
 
-        walls: dict[Segment, Building] = {}
+        # Wall colors depend only on the wall direction, so compute them once
+        # instead of for every height.
+        wall_fills: list[str] = [
+            get_wall_fill(building, segment) for segment, building in walls
+        ]
 
+        roofs: dict[float, list[Building]] = {}
         for building in constructor.buildings:
-            for part in building.parts:
-                walls[part] = building
-
-        sorted_walls = sorted(walls.keys())
-
-        previous_height: float = 0.0
-        for height in sorted(constructor.heights):
-            shift_1: np.ndarray = np.array(
-                (0.0, -previous_height * scale * BUILDING_SCALE)
+            roofs.setdefault(building.height, []).append(building)
+
+        heights: list[float] = sorted(constructor.heights)
+        heights_array: np.ndarray = np.array(heights, dtype=float)
+
+        # Vertical shifts of all heights, prepended with the zero shift of the
+        # ground level: walls between heights `i - 1` and `i` are drawn from
+        # `shifts[i]` to `shifts[i + 1]`.
+        shifts: np.ndarray = np.zeros((len(heights) + 1, 2))
+        shifts[1:, 1] = -heights_array * scale * BUILDING_SCALE
+
+        for height_index, height in enumerate(heights):
+            shift_1: np.ndarray = shifts[height_index]
+            shift_2: np.ndarray = shifts[height_index + 1]
+            active: np.ndarray = get_active_walls(
+                height, wall_min_heights, wall_heights
             )
-            shift_2: np.ndarray = np.array(
-                (0.0, -height * scale * BUILDING_SCALE)
-            )
-            for wall in sorted_walls:
-                building: Building = walls[wall]
-                if building.height < height or building.min_height >= height:
-                    continue
-
-                draw_walls(self.svg, building, wall, height, shift_1, shift_2)
+            for index in np.flatnonzero(active):
+                draw_walls(
+                    self.svg,
+                    wall_buildings[index],
+                    wall_segments[index],
+                    height,
+                    shift_1,
+                    shift_2,
+                    wall_fills[index],
+                )
 
             if self.configuration.draw_roofs:
-                for building in constructor.buildings:
-                    if building.height == height:
-                        building.draw_roof(self.svg, self.flinger, scale)
-
-            previous_height = height
+                for building in roofs.get(height, []):
+                    building.draw_roof(self.svg, self.flinger, scale)
 
     def draw_simple_roads(self, roads: Iterator[Road]) -> None:
         """Draw road as simple SVG path."""
-        nodes: dict[OSMNode, set[RoadPart]] = {}
+        road_list: list[Road] = list(roads)
+
+        # Fling all road nodes at once.
+        indices: dict[int, int] = {}
+        coordinates: list[np.ndarray] = []
+        for road in road_list:
+            for node in road.nodes:
+                if node.id_ not in indices:
+                    indices[node.id_] = len(coordinates)
+                    coordinates.append(node.coordinates)
+        if not indices:
+            return
+        coordinates_array: np.ndarray = np.array(coordinates)
+        points: np.ndarray = self.flinger.fling_batch(coordinates_array)
+        scales: np.ndarray = self.flinger.get_scale_batch(coordinates_array)
 
-        for road in roads:
+        parts_by_id: defaultdict[int, list[RoadPart]] = defaultdict(list)
+
+        for road in road_list:
             for index in range(len(road.nodes) - 1):
                 node_1: OSMNode = road.nodes[index]
                 node_2: OSMNode = road.nodes[index + 1]
-                point_1: np.ndarray = self.flinger.fling(node_1.coordinates)
-                point_2: np.ndarray = self.flinger.fling(node_2.coordinates)
-                scale: float = self.flinger.get_scale(node_1.coordinates)
+                point_1: np.ndarray = points[indices[node_1.id_]]
+                point_2: np.ndarray = points[indices[node_2.id_]]
+                scale: float = scales[indices[node_1.id_]]
                 part_1: RoadPart = RoadPart(point_1, point_2, road.lanes, scale)
                 part_2: RoadPart = RoadPart(point_2, point_1, road.lanes, scale)
                 # part_1.draw_normal(self.svg)
 
-                for node in node_1, node_2:
-                    if node not in nodes:
-                        nodes[node] = set()
-
-                nodes[node_1].add(part_1)
-                nodes[node_2].add(part_2)
+                parts_by_id[node_1.id_].append(part_1)
+                parts_by_id[node_2.id_].append(part_2)
 
-        for node, parts in nodes.items():
+        for parts in parts_by_id.values():
             if len(parts) < 4:
                 continue
-            intersection: Intersection = Intersection(list(parts))
+            intersection: Intersection = Intersection(parts)
             intersection.draw(self.svg, True)
 
     def draw_credits(self, size: np.ndarray):
@@ -256,6 +342,19 @@ def fatal(message: str) -> None:
     sys.exit(1)
 
 
+def parse_vector(text: str) -> Optional[np.ndarray]:
+    """
+    Parse comma-separated numbers.
+
+    :param text: numbers separated by commas, e.g. `50.0,40.0`
+    :return: array of numbers or `None` if text is malformed
+    """
+    try:
+        return np.array([float(x) for x in text.split(",")])
+    except ValueError:
+        return None
+
+
 def render_map(arguments: argparse.Namespace) -> None:
     """
     Map rendering entry point.
@@ -276,18 +375,18 @@ def render_map(arguments: argparse.Namespace) -> None:
         boundary_box = BoundaryBox.from_text(arguments.boundary_box)
 
     elif arguments.coordinates and arguments.size:
-        coordinates: Optional[np.ndarray] = None
-
-        for delimiter in ",", "/":
-            if delimiter in arguments.coordinates:
-                coordinates = np.array(
-                    list(map(float, arguments.coordinates.split(delimiter)))
-                )
-
-        if coordinates is None or len(coordinates) != 2:
+        # Coordinates may be separated either with comma or with slash.
+        coordinates: Optional[np.ndarray] = parse_vector(
+            arguments.coordinates.replace("/", ",")
+        )
+        if coordinates is None or coordinates.size != 2:
             fatal("Wrong coordinates format.")
 
-        width, height = np.array(list(map(float, arguments.size.split(","))))
+        dimensions: Optional[np.ndarray] = parse_vector(arguments.size)
+        if dimensions is None or dimensions.size != 2:
+            fatal("Wrong size format.")
+
+        width, height = dimensions
         boundary_box = BoundaryBox.from_coordinates(
             coordinates, configuration.zoom_level, width, height
         )
@@ -337,8 +436,8 @@ def render_map(arguments: argparse.Namespace) -> None:
     )
     size: np.ndarray = flinger.size
 
-    svg: svgwrite.Drawing = svgwrite.Drawing(arguments.output_file_name, size)
-    icon_extractor: ShapeExtractor = ShapeExtractor(
+    svg: SVGBuffer = SVGBuffer(arguments.output_file_name, size)
+    icon_extractor: ShapeExtractor = get_shape_extractor(
         workspace.ICONS_PATH, workspace.ICONS_CONFIG_PATH
     )
 
@@ -358,5 +457,8 @@ def render_map(arguments: argparse.Namespace) -> None:
     map_.draw(constructor)
 
     logging.info(f"Writing output SVG to {arguments.output_file_name}...")
-    with open(arguments.output_file_name, "w", encoding="utf-8") as output_file:
-        svg.write(output_file)
+    buffer: io.StringIO = io.StringIO()
+    svg.write(buffer)
+    Path(arguments.output_file_name).write_text(
+        buffer.getvalue(), encoding="utf-8"
+    )
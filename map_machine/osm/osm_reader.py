@@ -27,18 +27,6 @@ EARTH_EQUATOR_LENGTH: float = 40_075_017.0
 
 Tags = dict[str, str]
 
-# See https://wiki.openstreetmap.org/wiki/Lifecycle_prefix#Stages_of_decay
-STAGES_OF_DECAY: list[str] = [
-    "disused",
-    "abandoned",
-    "ruins",
-    "demolished",
-    "removed",
-    "razed",
-    "destroyed",
-    "was",  # is not actually a stage of decay
-]
-
 
 def parse_float(string: str) -> Optional[float]:
     """Parse string representation of a float or integer value."""
@@ -439,10 +427,28 @@ class OSMData:
 
         See https://wiki.openstreetmap.org/wiki/OSM_XML
 
+        XML is parsed incrementally: every top-level element is discarded as
+        soon as it is parsed, so the whole XML tree is never kept in memory.
+
         :param file_name: input XML file
         :return: parsed map
         """
-        self.parse_osm(ElementTree.parse(file_name).getroot())
+        root: Optional[Element] = None
+        depth: int = 0
+
+        for event, element in ElementTree.iterparse(
+            file_name, events=("start", "end")
+        ):
+            if event == "start":
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1:
+                self.parse_element(element)
+                root.clear()
 
     def parse_osm_text(self, text: str) -> None:
         """
@@ -469,17 +475,36 @@ class OSMData:
         :param parse_relations: whether relations should be parsed
         """
         for element in root:
-            if element.tag == "bounds":
-                self.parse_bounds(element)
-            elif element.tag == "object":
-                self.parse_object(element)
-            elif element.tag == "node" and parse_nodes:
-                node = OSMNode.from_xml_structure(element)
-                self.add_node(node)
-            elif element.tag == "way" and parse_ways:
-                self.add_way(OSMWay.from_xml_structure(element, self.nodes))
-            elif element.tag == "relation" and parse_relations:
-                self.add_relation(OSMRelation.from_xml_structure(element))
+            self.parse_element(
+                element, parse_nodes, parse_ways, parse_relations
+            )
+
+    def parse_element(
+        self,
+        element: Element,
+        parse_nodes: bool = True,
+        parse_ways: bool = True,
+        parse_relations: bool = True,
+    ) -> None:
+        """
+        Parse top-level element of OSM XML data.
+
+        :param element: child element of the top XML element
+        :param parse_nodes: whether nodes should be parsed
+        :param parse_ways: whether ways should be parsed
+        :param parse_relations: whether relations should be parsed
+        """
+        if element.tag == "bounds":
+            self.parse_bounds(element)
+        elif element.tag == "object":
+            self.parse_object(element)
+        elif element.tag == "node" and parse_nodes:
+            node = OSMNode.from_xml_structure(element)
+            self.add_node(node)
+        elif element.tag == "way" and parse_ways:
+            self.add_way(OSMWay.from_xml_structure(element, self.nodes))
+        elif element.tag == "relation" and parse_relations:
+            self.add_relation(OSMRelation.from_xml_structure(element))
 
     def parse_bounds(self, element: Element) -> None:
         """Parse view box from XML element."""
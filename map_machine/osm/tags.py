@@ -39,3 +39,15 @@ RAILWAY_VALUES: list[str] = [
     "disused",
     "abandoned",
 ]
+
+# See https://wiki.openstreetmap.org/wiki/Lifecycle_prefix#Stages_of_decay
+STAGES_OF_DECAY: list[str] = [
+    "disused",
+    "abandoned",
+    "ruins",
+    "demolished",
+    "removed",
+    "razed",
+    "destroyed",
+    "was",  # is not actually a stage of decay
+]
@@ -3,6 +3,7 @@ import json
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 from xml.etree import ElementTree
@@ -351,6 +352,38 @@ class ShapeExtractor:
         assert False, f"no shape with id {id_} in icons file"
 
 
+def get_shape_extractor(
+    svg_file_name: Path, configuration_file_name: Path
+) -> ShapeExtractor:
+    """
+    Get shape extractor for the files.  The extractor is created once and
+    reused until one of the files is modified.
+
+    :param svg_file_name: input SVG file name with icons
+    :param configuration_file_name: JSON file with grouped shape descriptions
+    """
+    return create_shape_extractor(
+        svg_file_name,
+        configuration_file_name,
+        svg_file_name.stat().st_mtime_ns,
+        configuration_file_name.stat().st_mtime_ns,
+    )
+
+
+@lru_cache(maxsize=None)
+def create_shape_extractor(
+    svg_file_name: Path,
+    configuration_file_name: Path,
+    svg_modification_time: int,
+    configuration_modification_time: int,
+) -> ShapeExtractor:
+    """
+    Create shape extractor.  File modification times are not used directly and
+    are only the part of the cache key.
+    """
+    return ShapeExtractor(svg_file_name, configuration_file_name)
+
+
 @dataclass
 class ShapeSpecification:
     """Specification for shape as a part of an icon."""
@@ -1,8 +1,9 @@
 """Map Machine drawing scheme."""
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -10,6 +11,7 @@ import numpy as np
 import yaml
 from colour import Color
 
+from map_machine.drawing import get_svg_attributes
 from map_machine.feature.direction import DirectionSet
 from map_machine.map_configuration import MapConfiguration
 from map_machine.osm.osm_reader import Tagged, Tags
@@ -36,6 +38,18 @@ class LineStyle:
     style: dict[str, Union[int, float, str]]
     parallel_offset: float = 0.0
     priority: float = 0.0
+    _svg_attributes: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def svg_attributes(self) -> str:
+        """
+        Get style serialized into SVG attributes.  The string is computed once
+        and shared by all figures with this style.
+        """
+        if self._svg_attributes is None:
+            self._svg_attributes = get_svg_attributes(self.style)
+        return self._svg_attributes
 
 
 class MatchingType(Enum):
@@ -278,6 +292,12 @@ class WayMatcher(Matcher):
         if parallel_offset := structure.get("parallel_offset"):
             self.parallel_offset = parallel_offset
 
+        # Shared by all matched figures, so that serialized SVG attributes are
+        # computed once per matcher.
+        self.line_style: LineStyle = LineStyle(
+            self.style, self.parallel_offset, self.priority
+        )
+
     def get_style(self) -> dict[str, Any]:
         """Return way SVG style."""
         return self.style
@@ -307,6 +327,19 @@ class RoadMatcher(Matcher):
         return 1000.0 * layer + self.priority
 
 
+@lru_cache(maxsize=None)
+def read_scheme_file(file_name: Path, modification_time: int) -> dict[str, Any]:
+    """
+    Parse scheme file.
+
+    :param file_name: name of the scheme file
+    :param modification_time: file modification time, is not used directly and
+        is only the part of the cache key
+    """
+    with file_name.open(encoding="utf-8") as input_file:
+        return yaml.load(input_file.read(), Loader=yaml.FullLoader)
+
+
 class Scheme:
     """
     Map style.
@@ -365,14 +398,13 @@ class Scheme:
     @classmethod
     def from_file(cls, file_name: Path) -> "Scheme":
         """
+        Parsed file content is reused until the file is modified, so that
+        drawing of several maps (e.g. tiles) doesn't parse YAML every time.
+
         :param file_name: name of the scheme file with tags, colors, and tag key
             specification
         """
-        with file_name.open(encoding="utf-8") as input_file:
-            content: dict[str, Any] = yaml.load(
-                input_file.read(), Loader=yaml.FullLoader
-            )
-            return cls(content)
+        return cls(read_scheme_file(file_name, file_name.stat().st_mtime_ns))
 
     def get_color(self, color: str) -> Color:
         """
@@ -601,10 +633,7 @@ class Scheme:
             if not matching:
                 continue
 
-            line_style: LineStyle = LineStyle(
-                matcher.style, matcher.parallel_offset, matcher.priority
-            )
-            line_styles.append(line_style)
+            line_styles.append(matcher.line_style)
 
         return line_styles
 
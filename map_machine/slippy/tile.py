@@ -12,17 +12,17 @@ from typing import Optional
 
 import cairosvg
 import numpy as np
-import svgwrite
 from PIL import Image
 
 from map_machine.constructor import Constructor
+from map_machine.drawing import SVGBuffer
 from map_machine.geometry.boundary_box import BoundaryBox
 from map_machine.geometry.flinger import Flinger
 from map_machine.map_configuration import MapConfiguration
 from map_machine.mapper import Map
 from map_machine.osm.osm_getter import NetworkError, get_osm
 from map_machine.osm.osm_reader import OSMData
-from map_machine.pictogram.icon import ShapeExtractor
+from map_machine.pictogram.icon import ShapeExtractor, get_shape_extractor
 from map_machine.scheme import Scheme
 from map_machine.workspace import workspace
 
@@ -167,10 +167,8 @@ class Tile:
 
         output_file_name: Path = self.get_file_name(directory_name)
 
-        svg: svgwrite.Drawing = svgwrite.Drawing(
-            str(output_file_name), size=size
-        )
-        icon_extractor: ShapeExtractor = ShapeExtractor(
+        svg: SVGBuffer = SVGBuffer(str(output_file_name), size=size)
+        icon_extractor: ShapeExtractor = get_shape_extractor(
             workspace.ICONS_PATH, workspace.ICONS_CONFIG_PATH
         )
         scheme: Scheme = Scheme.from_file(workspace.DEFAULT_SCHEME_PATH)
@@ -387,7 +385,7 @@ class Tiles:
                 self.zoom_level,
                 osm_data.equator_length,
             )
-            extractor: ShapeExtractor = ShapeExtractor(
+            extractor: ShapeExtractor = get_shape_extractor(
                 workspace.ICONS_PATH, workspace.ICONS_CONFIG_PATH
             )
             scheme: Scheme = Scheme.from_file(workspace.DEFAULT_SCHEME_PATH)
@@ -396,9 +394,7 @@ class Tiles:
             )
             constructor.construct()
 
-            svg: svgwrite.Drawing = svgwrite.Drawing(
-                str(output_path), size=flinger.size
-            )
+            svg: SVGBuffer = SVGBuffer(str(output_path), size=flinger.size)
             map_: Map = Map(flinger, svg, scheme, configuration)
             map_.draw(constructor)
 
@@ -3,7 +3,7 @@ import argparse
 
 from map_machine import __version__
 from map_machine.map_configuration import BuildingMode, DrawingMode, LabelMode
-from map_machine.osm.osm_reader import STAGES_OF_DECAY
+from map_machine.osm.tags import STAGES_OF_DECAY
 
 __author__ = "Sergey Vartanov"
 __email__ = "me@enzet.ru"
@@ -201,6 +201,13 @@ def add_map_arguments(parser: argparse.ArgumentParser) -> None:
         action=argparse.BooleanOptionalAction,
         default=False,
     )
+    parser.add_argument(
+        "--jobs",
+        default=1,
+        type=int,
+        help="number of threads used to compute figure paths",
+        metavar="<integer>",
+    )
 
 
 def add_tile_arguments(parser: argparse.ArgumentParser) -> None:
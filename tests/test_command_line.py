@@ -49,6 +49,19 @@ def test_wrong_render_arguments() -> None:
     )
 
 
+def test_wrong_render_coordinates() -> None:
+    """Test `render` command with malformed coordinates and size."""
+    for coordinates in "50,40,abc", "50.0;40.0", "abc":
+        error_run(
+            ["render", "--coordinates", coordinates, "--size", "10,10"],
+            b"CRITICAL Wrong coordinates format.\n",
+        )
+    error_run(
+        ["render", "--coordinates", "50,40", "--size", "10,abc"],
+        b"CRITICAL Wrong size format.\n",
+    )
+
+
 def test_render() -> None:
     """Test `render` command."""
     run(
@@ -3,7 +3,9 @@ Test coordinates computation.
 """
 import numpy as np
 
+from map_machine.geometry.boundary_box import BoundaryBox
 from map_machine.geometry.flinger import (
+    Flinger,
     osm_zoom_level_to_pixels_per_meter,
     pseudo_mercator,
 )
@@ -26,3 +28,21 @@ def test_osm_zoom_level_to_pixels_per_meter() -> None:
     assert np.allclose(
         osm_zoom_level_to_pixels_per_meter(18, 40_075_017.0), 1.6745810488364858
     )
+
+
+def test_fling_batch() -> None:
+    """Test that batch methods are equivalent to per-point computation."""
+    flinger: Flinger = Flinger(
+        BoundaryBox(10.0, 20.0, 10.01, 20.01), 18.0, 40_075_017.0
+    )
+    coordinates: np.ndarray = np.array(
+        ((20.0, 10.0), (20.005, 10.002), (20.01, 10.01))
+    )
+    assert np.allclose(
+        flinger.fling_batch(coordinates),
+        np.array([flinger.fling(x) for x in coordinates]),
+    )
+    assert np.allclose(
+        flinger.get_scale_batch(coordinates),
+        np.array([flinger.get_scale(x) for x in coordinates]),
+    )
@@ -1,6 +1,8 @@
 """
 Test OSM XML parsing.
 """
+from pathlib import Path
+
 import numpy as np
 
 from map_machine.osm.osm_reader import (
@@ -106,6 +108,31 @@ def test_relation() -> None:
     assert relation.members[0].ref == 2
 
 
+def test_file(tmp_path: Path) -> None:
+    """Test OSM XML file parsing."""
+    path: Path = tmp_path / "map.osm"
+    path.write_text(
+        """<?xml version="1.0"?>
+<osm>
+  <bounds minlat="10" minlon="5" maxlat="11" maxlon="6" />
+  <node id="1" lon="5" lat="10" />
+  <node id="2" lon="6" lat="11" />
+  <way id="3">
+    <nd ref="1" />
+    <nd ref="2" />
+    <tag k="key" v="value" />
+  </way>
+</osm>"""
+    )
+    osm_data: OSMData = OSMData()
+    osm_data.parse_osm_file(path)
+    assert np.allclose(osm_data.view_box.max_(), np.array((11, 6)))
+    assert set(osm_data.nodes) == {1, 2}
+    way: OSMWay = osm_data.ways[3]
+    assert [node.id_ for node in way.nodes] == [1, 2]
+    assert way.tags["key"] == "value"
+
+
 def test_parse_levels() -> None:
     """Test level parsing."""
     assert parse_levels("1") == [1]
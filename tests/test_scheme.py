@@ -1,6 +1,8 @@
 """
 Test scheme parsing.
 """
+import os
+from pathlib import Path
 from typing import Any
 
 from map_machine.scheme import Scheme
@@ -22,3 +24,19 @@ def test_verification() -> None:
         "node_icons": [{"tags": [{"tags": {"a": 0}}]}],
     }
     assert Scheme(tags).node_matchers[0].verify() is False
+
+
+def test_file_cache(tmp_path: Path) -> None:
+    """Test that scheme file is parsed again only after modification."""
+    path: Path = tmp_path / "scheme.yml"
+    path.write_text('colors: {default: "#444444"}\n', encoding="utf-8")
+
+    scheme_1: Scheme = Scheme.from_file(path)
+    scheme_2: Scheme = Scheme.from_file(path)
+    assert scheme_1 is not scheme_2
+    assert scheme_1.colors is scheme_2.colors
+
+    path.write_text('colors: {default: "#888888"}\n', encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert Scheme.from_file(path).colors == {"default": "#888888"}
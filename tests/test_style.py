@@ -22,3 +22,10 @@ def test_style_area() -> None:
     style = SCHEME.get_style({"landuse": "grass"})
     assert len(style) == 1
     assert style[0].style == {"fill": "#CFE0A8", "stroke": "#BFD098"}
+
+
+def test_style_svg_attributes() -> None:
+    """Test serializing style into SVG attributes."""
+    style = SCHEME.get_style({"landuse": "grass"})[0]
+    assert style.svg_attributes() == ' fill="#CFE0A8" stroke="#BFD098"'
+    assert style is SCHEME.get_style({"landuse": "grass"})[0]
@@ -6,11 +6,15 @@ expected figures in the expected order.
 """
 import numpy as np
 
+from svgwrite.path import Path as SVGPath
+
 from map_machine.constructor import Constructor
+from map_machine.drawing import SVGBuffer
 from map_machine.figure import Figure
 from map_machine.geometry.boundary_box import BoundaryBox
 from map_machine.geometry.flinger import Flinger
 from map_machine.map_configuration import MapConfiguration
+from map_machine.mapper import Map
 from map_machine.osm.osm_reader import OSMData, OSMWay, OSMNode, Tags
 from tests import SCHEME, SHAPE_EXTRACTOR
 
@@ -58,6 +62,65 @@ def test_river_and_wood() -> None:
     assert figures[1].tags["waterway"] == "river"
 
 
+def test_partitioned_figures() -> None:
+    """Check that figures are split by priority."""
+    osm_data: OSMData = OSMData()
+    create_way(osm_data, {"natural": "wood"}, 1)
+    create_way(osm_data, {"waterway": "river"}, 2)
+    constructor: Constructor = get_constructor(osm_data)
+    river: Figure = constructor.get_sorted_figures()[1]
+
+    bottom, top = constructor.get_partitioned_figures(river.line_style.priority)
+
+    assert [x.tags for x in bottom] == [{"natural": "wood"}]
+    assert [x.tags for x in top] == [{"waterway": "river"}]
+
+
+def draw_simple_crossing(second_way_nodes: list[int]) -> SVGBuffer:
+    """
+    Draw simple roads for two residential ways: the first one goes through
+    nodes 2, 1, and 3, the second one goes through the given nodes.  Node 1
+    is in the center, nodes 2, 3, 4, and 5 are around it.
+    """
+    osm_data: OSMData = OSMData()
+    for id_, coordinates in (
+        (1, (0.0, 0.0)),
+        (2, (0.001, 0.0)),
+        (3, (-0.001, 0.0)),
+        (4, (0.0, 0.001)),
+        (5, (0.0, -0.001)),
+    ):
+        osm_data.add_node(OSMNode({}, id_, np.array(coordinates)))
+    for id_, node_ids in (1, [2, 1, 3]), (2, second_way_nodes):
+        nodes: list[OSMNode] = [osm_data.nodes[x] for x in node_ids]
+        osm_data.add_way(OSMWay({"highway": "residential"}, id_, nodes))
+
+    constructor: Constructor = get_constructor(osm_data)
+    svg: SVGBuffer = SVGBuffer("map.svg", constructor.flinger.size)
+    map_: Map = Map(constructor.flinger, svg, SCHEME, MapConfiguration())
+    map_.draw_simple_roads(constructor.roads.roads)
+
+    return svg
+
+
+def test_simple_roads_intersection() -> None:
+    """Check that simple roads draw intersection of four road parts."""
+    svg: SVGBuffer = draw_simple_crossing([4, 1, 5])
+    intersections: list[SVGPath] = [
+        x
+        for x in svg.elements
+        if isinstance(x, SVGPath) and x.attribs.get("fill") == "#0000FF"
+    ]
+    assert len(intersections) == 1
+    assert intersections[0].attribs["opacity"] == 0.2
+
+
+def test_simple_roads_no_intersection() -> None:
+    """Check that simple roads don't draw junction of three road parts."""
+    svg: SVGBuffer = draw_simple_crossing([1, 4])
+    assert svg.elements == [svg.defs]
+
+
 def test_placement_and_lanes() -> None:
     """
     Check that `placement` tag is processed correctly when `lanes` tag is not